@@ -1,23 +1,59 @@
-import json
+import atexit
+import functools
+import hashlib
+import hmac
+import logging
 import os
+import queue
+import re
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 import google.generativeai as genai
 import jwt
+import orjson
 import requests
+from cachetools import TTLCache
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request, Response
+from flask import Flask, request, Response
 from flask.typing import ResponseReturnValue
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from limits import parse as parse_rate_limit
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 load_dotenv()
 
+# --- Logging Setup ---
+# Records are handed to a queue and written to stderr by a listener thread, so
+# request and worker threads never block on the stream lock.
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s [%(threadName)s] %(message)s")
+)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # --- Environment Setup ---
 try:
     GEMINI_API_KEY: Optional[str] = os.getenv("GEMINI_API_KEY")
     GITHUB_APP_ID: Optional[str] = os.getenv("GITHUB_APP_ID")
     GITHUB_PRIVATE_KEY_PATH: Optional[str] = os.getenv("GITHUB_PRIVATE_KEY_PATH")
+    GITHUB_WEBHOOK_SECRET: Optional[str] = os.getenv("GITHUB_WEBHOOK_SECRET")
 
     if not GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY not set!")
@@ -25,156 +61,483 @@ try:
         raise ValueError("GITHUB_APP_ID not set!")
     if not GITHUB_PRIVATE_KEY_PATH:
         raise ValueError("GITHUB_PRIVATE_KEY_PATH not set!")
+    if not GITHUB_WEBHOOK_SECRET:
+        raise ValueError("GITHUB_WEBHOOK_SECRET not set!")
 
-    with open(GITHUB_PRIVATE_KEY_PATH, "r") as key_file:
-        GITHUB_PRIVATE_KEY: str = key_file.read()
+    # Parse the PEM once so signing JWTs doesn't re-decode the key every time.
+    with open(GITHUB_PRIVATE_KEY_PATH, "rb") as key_file:
+        GITHUB_PRIVATE_KEY: PrivateKeyTypes = serialization.load_pem_private_key(
+            key_file.read(), password=None
+        )
 
-    print("Environment variables and Private Key loaded.")
+    logger.info("Environment variables and Private Key loaded.")
 
 except Exception as e:
-    print(f"🚨 Error loading configuration: {e}")
-    GEMINI_API_KEY = GITHUB_APP_ID = GITHUB_PRIVATE_KEY = None
+    logger.error("🚨 Error loading configuration: %s", e)
+    GEMINI_API_KEY = GITHUB_APP_ID = GITHUB_PRIVATE_KEY = GITHUB_WEBHOOK_SECRET = None
 
 # --- Model Initialization ---
+# The fixed analysis instruction is set once as the model's system instruction,
+# keeping it separate from the issue text in the prompt. The client still sends
+# it with every request, so this doesn't reduce the tokens sent or billed.
+SYSTEM_INSTRUCTION = (
+    "You are a GitHub issue summarizer. Analyze the GitHub issue you are given "
+    "and provide a brief summary (1-2 sentences)."
+)
+
+# Gemini latency grows with input size and a 1-2 sentence summary doesn't need
+# whole logs, so issue bodies are stripped of template comments and capped.
+MAX_ISSUE_BODY_CHARS = 8000
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
 model: Optional[genai.GenerativeModel] = None
 if GEMINI_API_KEY:
     try:
         genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        print("✨ Gemini AI Model Initialized Successfully! ✨")
+        model = genai.GenerativeModel(
+            "gemini-2.0-flash", system_instruction=SYSTEM_INSTRUCTION
+        )
+        logger.info("✨ Gemini AI Model Initialized Successfully! ✨")
     except Exception as e:
-        print(f"🚨 Error initializing Gemini: {e}")
-
-
-def create_jwt(app_id: str, private_key: str) -> str:
-    """Creates a JSON Web Token (JWT) for GitHub App authentication."""
-    now = int(time.time())
-    payload = {
-        "iat": now - 60,
-        "exp": now + (9 * 60),
-        "iss": app_id,
-    }
-    encoded_jwt: str = jwt.encode(payload, private_key, algorithm="RS256")
-    print("🔑 JWT Created.")
+        logger.error("🚨 Error initializing Gemini: %s", e)
+
+# --- GitHub HTTP Session ---
+# A shared session keeps connections to api.github.com alive across webhooks
+# so each call doesn't pay for a fresh TCP + TLS handshake.
+GITHUB_REQUEST_TIMEOUT = (3.05, 10)
+# Send small request bodies immediately (no Nagle delay) and let the OS probe
+# idle pooled connections so dead ones are noticed.
+GITHUB_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """An HTTPAdapter whose pooled connections use GITHUB_SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = GITHUB_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+_gh_session = requests.Session()
+_gh_session.headers["Accept"] = "application/vnd.github.v3+json"
+_gh_session.mount(
+    "https://",
+    SocketOptionsAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+        ),
+    ),
+)
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# addComment mutations aren't idempotent: a 5xx or read timeout may arrive after
+# GitHub applied them, so only retry failures to connect (nothing was sent).
+_gh_session.mount(
+    GITHUB_GRAPHQL_URL,
+    SocketOptionsAdapter(
+        max_retries=Retry(
+            connect=3, read=False, status=False, other=False, backoff_factor=0.2
+        ),
+    ),
+)
+
+# --- Comment Batching ---
+# Comments are queued and posted as one multi-mutation GraphQL request per
+# installation token, so a burst of new issues shares a single round trip.
+COMMENT_BATCH_SIZE = 10
+COMMENT_BATCH_WINDOW_SECONDS = 0.2
+_comment_queue: queue.Queue = queue.Queue()
+
+# --- GitHub Token Cache ---
+# Installation tokens are valid for an hour, so reuse them per installation
+# until shortly before they expire instead of minting one per webhook.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+_token_cache: dict[int, tuple[str, float]] = {}
+_token_cache_lock = threading.Lock()
+
+# Token fetches run on their own small pool so issue workers can wait on them
+# without competing for (and possibly starving) their own pool's threads.
+_auth_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="github-auth")
+
+# App JWTs are valid for 9 minutes; reuse one until 2 minutes before expiry
+# rather than paying for an RSA signature on every token exchange.
+JWT_EXPIRY_MARGIN_SECONDS = 120
+_jwt_cache: dict = {"iss": None, "token": None, "exp": 0}
+_jwt_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _auth_headers(token: str) -> dict[str, str]:
+    """Returns the (shared, do not mutate) Authorization headers for a token.
+
+    Tokens are cached and reused, so their headers are built once per token.
+    """
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create_jwt(app_id: str, private_key: PrivateKeyTypes) -> str:
+    """Creates a JSON Web Token (JWT) for GitHub App authentication.
+
+    The JWT is cached and reused until it is within JWT_EXPIRY_MARGIN_SECONDS
+    of expiring.
+    """
+    with _jwt_cache_lock:
+        if (
+            _jwt_cache["iss"] == app_id
+            and _jwt_cache["exp"] - time.time() > JWT_EXPIRY_MARGIN_SECONDS
+        ):
+            return _jwt_cache["token"]
+
+        now = int(time.time())
+        payload = {
+            "iat": now - 60,
+            "exp": now + (9 * 60),
+            "iss": app_id,
+        }
+        # GitHub only accepts RS256 for App JWTs; caching keeps signing rare.
+        encoded_jwt: str = jwt.encode(payload, private_key, algorithm="RS256")
+        _jwt_cache.update(iss=app_id, token=encoded_jwt, exp=payload["exp"])
+    logger.info("🔑 JWT Created.")
     return encoded_jwt
 
 
 def get_installation_token(
-    app_id: str, private_key: str, installation_id: int
+    app_id: str, private_key: PrivateKeyTypes, installation_id: int
 ) -> Optional[str]:
-    """Gets an installation access token for a specific installation."""
+    """Gets an installation access token for a specific installation.
+
+    Tokens are cached per installation and reused until they are within
+    TOKEN_EXPIRY_MARGIN_SECONDS of expiring.
+    """
+    with _token_cache_lock:
+        cached = _token_cache.get(installation_id)
+    if cached:
+        token, expiry = cached
+        if expiry - time.time() > TOKEN_EXPIRY_MARGIN_SECONDS:
+            logger.info("🔒 Using cached installation token.")
+            return token
+
     jwt_token = create_jwt(app_id, private_key)
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    headers = _auth_headers(jwt_token)
     token_url = (
         f"https://api.github.com/app/installations/" f"{installation_id}/access_tokens"
     )
 
     try:
-        response = requests.post(token_url, headers=headers)
+        response = _gh_session.post(
+            token_url, headers=headers, timeout=GITHUB_REQUEST_TIMEOUT
+        )
         response.raise_for_status()
         token_data: dict = response.json()
-        print(
-            f"🔒 Installation Token Obtained " f"(expires: {token_data['expires_at']})."
+        logger.info(
+            "🔒 Installation Token Obtained (expires: %s).", token_data["expires_at"]
         )
+        expiry = datetime.fromisoformat(token_data["expires_at"]).timestamp()
+        with _token_cache_lock:
+            _token_cache[installation_id] = (token_data["token"], expiry)
         return token_data["token"]
     except requests.exceptions.RequestException as e:
-        print(f"🚨 Error getting installation token: {e}")
-        print(f"Response content: {response.content}")
+        logger.error("🚨 Error getting installation token: %s", e)
+        logger.error("Response content: %s", getattr(e.response, "content", None))
         return None
 
 
-def add_comment_to_issue(issue_url: str, token: str, comment_body: str) -> bool:
-    """Adds a comment to a GitHub issue."""
-    comments_url = f"{issue_url}/comments"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    data = {"body": comment_body}
+def add_comments_to_issues(token: str, comments: list[tuple[str, str]]) -> bool:
+    """Adds comments to GitHub issues in a single GraphQL request.
+
+    Each comment is a (issue node ID, comment body) pair; all of them must be
+    postable with the same installation token.
+    """
+    params = []
+    mutations = []
+    variables = {}
+    for i, (subject_id, body) in enumerate(comments):
+        params.append(f"$id{i}: ID!, $body{i}: String!")
+        mutations.append(
+            f"c{i}: addComment(input: {{subjectId: $id{i}, body: $body{i}}}) "
+            "{ clientMutationId }"
+        )
+        variables[f"id{i}"] = subject_id
+        variables[f"body{i}"] = body
+    query = f"mutation({', '.join(params)}) {{ {' '.join(mutations)} }}"
+    headers = _auth_headers(token)
 
     try:
-        response = requests.post(comments_url, headers=headers, json=data)
+        response = _gh_session.post(
+            GITHUB_GRAPHQL_URL,
+            headers=headers,
+            json={"query": query, "variables": variables},
+            timeout=GITHUB_REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
-        print(f"💬 Comment added successfully to {issue_url}")
+        errors = response.json().get("errors")
+        if errors:
+            logger.error("🚨 Error adding comments: %s", errors)
+            return False
+        logger.info("💬 %d comment(s) added successfully.", len(comments))
         return True
     except requests.exceptions.RequestException as e:
-        print(f"🚨 Error adding comment: {e}")
-        print(f"Response content: {response.content}")
+        logger.error("🚨 Error adding comments: %s", e)
+        logger.error("Response content: %s", getattr(e.response, "content", None))
+        return False
+
+
+def _comment_batch_worker() -> None:
+    """Drains the comment queue, posting up to COMMENT_BATCH_SIZE at a time."""
+    while True:
+        batch = [_comment_queue.get()]
+        deadline = time.monotonic() + COMMENT_BATCH_WINDOW_SECONDS
+        while len(batch) < COMMENT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_comment_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        by_token: dict[str, list[tuple[str, str]]] = {}
+        for token, subject_id, body in batch:
+            by_token.setdefault(token, []).append((subject_id, body))
+        for token, comments in by_token.items():
+            try:
+                add_comments_to_issues(token, comments)
+            except Exception as e:
+                logger.error("🚨 Error posting comment batch: %s", e)
+
+
+def queue_comment(token: str, issue_node_id: str, comment_body: str) -> None:
+    """Queues a comment to be posted with the next GraphQL batch."""
+    _comment_queue.put((token, issue_node_id, comment_body))
+
+
+def clean_issue_body(body: str) -> str:
+    """Truncates, then strips template comments and excess blank lines.
+
+    Truncating first bounds the regex work: the non-greedy comment pattern is
+    quadratic on bodies full of unclosed "<!--" markers.
+    """
+    body = body[:MAX_ISSUE_BODY_CHARS]
+    body = _HTML_COMMENT_RE.sub("", body)
+    return _BLANK_LINES_RE.sub("\n\n", body).strip()
+
+
+threading.Thread(
+    target=_comment_batch_worker, name="comment-batcher", daemon=True
+).start()
+
+
+def _process_issue_opened(
+    installation_id: int,
+    issue_node_id: str,
+    issue_title: Optional[str],
+    issue_body: Optional[str],
+) -> None:
+    """Summarizes a newly opened issue with Gemini and comments the summary."""
+    if issue_body:
+        issue_body = clean_issue_body(issue_body)
+    if not (issue_title and issue_body):
+        logger.info("Issue title or body missing.")
+        return
+
+    prompt = f"Issue Title: {issue_title}\nIssue Body:\n---\n{issue_body}\n---"
+
+    # The installation token doesn't depend on the summary, so fetch it while
+    # Gemini is generating.
+    logger.info("Attempting to authenticate with GitHub...")
+    token_future = _auth_executor.submit(
+        get_installation_token, GITHUB_APP_ID, GITHUB_PRIVATE_KEY, installation_id
+    )
+
+    try:
+        logger.info("Sending prompt to Gemini...")
+        response = model.generate_content(prompt)
+        gemini_summary: str = response.text.strip()
+        logger.info(
+            "--- Gemini Summary ---\n%s\n----------------------", gemini_summary
+        )
+
+        access_token = token_future.result()
+
+        if access_token:
+            logger.info("Authentication successful. Queueing comment...")
+            comment = f"🤖 **Gemini Analysis:**\n\n{gemini_summary}"
+            queue_comment(access_token, issue_node_id, comment)
+        else:
+            logger.error("🚨 Could not get access token. Cannot add comment.")
+
+    except Exception as e:
+        logger.error("🚨 Error during Gemini processing or GitHub action: %s", e)
+
+
+def verify_signature(body: bytes, signature_header: Optional[str]) -> bool:
+    """Checks the X-Hub-Signature-256 header against the raw request body."""
+    if not signature_header:
         return False
+    mac = hmac.new(GITHUB_WEBHOOK_SECRET.encode(), body, hashlib.sha256)
+    # Compare bytes: compare_digest rejects non-ASCII str with a TypeError, and
+    # the header is attacker-controlled.
+    return hmac.compare_digest(
+        f"sha256={mac.hexdigest()}".encode(), signature_header.encode("latin-1")
+    )
+
+
+def json_response(data: dict, status: int) -> Response:
+    """Serializes a JSON response body with orjson."""
+    return Response(orjson.dumps(data), status=status, mimetype="application/json")
+
+
+def _failed_authentication(response: Response) -> bool:
+    """Counts only rejected signatures against the webhook rate limit."""
+    return response.status_code == 401
 
 
 # --- Flask App ---
 app = Flask(__name__)
 
+# Limits are keyed on the caller's address, since any header value is
+# attacker-controlled before the signature is verified. /webhook replaces the
+# default with a limit that only counts failed authentications: genuine
+# deliveries all come from a few GitHub (or proxy) addresses and must never be
+# throttled, while an address sending forged requests is cut off before any
+# parsing. Use a shared backend (e.g. redis://localhost:6379) when running more
+# than one process so the limits apply across all of them.
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
+    default_limits=["100/minute"],
+)
+# Caps Gemini usage per tenant. Only applied after signature verification, as
+# the installation ID comes from the (then trusted) payload.
+INSTALLATION_RATE_LIMIT = parse_rate_limit("20/minute")
+
+# GitHub redelivers on failures and proxies can replay deliveries, so remember
+# recently queued delivery IDs to avoid summarizing the same issue twice.
+# This is per-process; multi-worker deployments each keep their own window.
+_seen_deliveries: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_seen_deliveries_lock = threading.Lock()
+
+
+def _reserve_delivery(delivery_id: str) -> bool:
+    """Records a delivery ID, returning False if it was already recorded."""
+    with _seen_deliveries_lock:
+        if delivery_id in _seen_deliveries:
+            return False
+        _seen_deliveries[delivery_id] = True
+        return True
+
+
+def _release_delivery(delivery_id: str) -> None:
+    """Forgets a delivery ID so a redelivery of it is processed again."""
+    with _seen_deliveries_lock:
+        _seen_deliveries.pop(delivery_id, None)
+
+
+# Gemini and GitHub calls take seconds, so issue processing runs on a worker
+# pool and the webhook is acknowledged as soon as the payload is validated.
+# The pool size bounds how many issues are summarized concurrently.
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS", "8"))
+executor = ThreadPoolExecutor(
+    max_workers=WEBHOOK_WORKERS, thread_name_prefix="webhook-worker"
+)
+
 
 @app.route("/webhook", methods=["POST"])
+@limiter.limit("30/minute", deduct_when=_failed_authentication)
 def github_webhook() -> ResponseReturnValue:
     """Listens for incoming GitHub webhooks and processes them."""
-    print("\n--- Webhook Received! ---")
-    if not (GITHUB_APP_ID and GITHUB_PRIVATE_KEY and model):
-        print("🚨 App not fully configured. Skipping processing.")
-        return jsonify({"status": "config_error"}), 500
-
-    if not request.is_json:
-        print("Request did not contain JSON data.")
-        return jsonify({"error": "Request must be JSON"}), 400
-
-    payload: dict = request.json
+    logger.info("--- Webhook Received! ---")
+    if not (GITHUB_APP_ID and GITHUB_PRIVATE_KEY and GITHUB_WEBHOOK_SECRET and model):
+        logger.error("🚨 App not fully configured. Skipping processing.")
+        return json_response({"status": "config_error"}, 500)
+
+    # Authenticate the delivery on the raw bytes before doing any parsing.
+    raw_body = request.get_data(cache=True)
+    if not verify_signature(raw_body, request.headers.get("X-Hub-Signature-256")):
+        logger.warning("🚨 Invalid webhook signature.")
+        return json_response({"error": "invalid_signature"}, 401)
+
+    # Reserve the delivery ID up front so concurrent copies of the same
+    # delivery can't both get past the check; release it unless it's queued.
+    delivery_id: Optional[str] = request.headers.get("X-GitHub-Delivery")
+    if delivery_id and not _reserve_delivery(delivery_id):
+        logger.info("Delivery %s already processed. Skipping.", delivery_id)
+        return json_response({"status": "duplicate"}, 200)
+
+    queued = False
+    try:
+        response = _handle_delivery(raw_body)
+        queued = response.status_code == 202
+        return response
+    finally:
+        if delivery_id and not queued:
+            _release_delivery(delivery_id)
+
+
+def _handle_delivery(raw_body: bytes) -> Response:
+    """Validates an authenticated delivery and queues opened issues."""
+    # Most deliveries (pushes, stars, ...) are not issue events; drop them
+    # before parsing the payload.
     event_type: Optional[str] = request.headers.get("X-GitHub-Event")
-    print(f"Event Type: {event_type}")
-
-    installation = payload.get("installation", {})
-    installation_id: Optional[int] = installation.get("id")
-    if not installation_id:
-        print("🚨 No installation ID found in payload. Cannot authenticate.")
-        return jsonify({"error": "missing_installation_id"}), 400
-
-    if event_type == "issues" and payload.get("action") == "opened":
-        issue_data = payload.get("issue", {})
-        issue_title: Optional[str] = issue_data.get("title")
-        issue_body: Optional[str] = issue_data.get("body")
-        issue_url: Optional[str] = issue_data.get("html_url")
-        issue_api_url: Optional[str] = issue_data.get("url")
-
-        print(f"Processing New Issue: {issue_title} ({issue_url})")
-
-        if issue_title and issue_body:
-            prompt = (
-                "Analyze this GitHub issue and provide a brief summary "
-                f"(1-2 sentences). Issue Title: {issue_title}\nIssue Body:\n---\n"
-                f"{issue_body}\n---"
-            )
+    logger.info("Event Type: %s", event_type)
+    if event_type != "issues":
+        return Response(status=204)
 
-            try:
-                print("Sending prompt to Gemini...")
-                response = model.generate_content(prompt)
-                gemini_summary: str = response.text.strip()
-                print(
-                    f"--- Gemini Summary ---\n{gemini_summary}\n"
-                    "----------------------"
-                )
-
-                print("Attempting to authenticate with GitHub...")
-                access_token = get_installation_token(
-                    GITHUB_APP_ID, GITHUB_PRIVATE_KEY, installation_id
-                )
-
-                if access_token:
-                    print("Authentication successful. Adding comment...")
-                    comment = f"🤖 **Gemini Analysis:**\n\n{gemini_summary}"
-                    add_comment_to_issue(issue_api_url, access_token, comment)
-                else:
-                    print("🚨 Could not get access token. Cannot add comment.")
-
-            except Exception as e:
-                print(f"🚨 Error during Gemini processing or GitHub action: {e}")
-        else:
-            print("Issue title or body missing.")
+    if not request.is_json:
+        logger.info("Request did not contain JSON data.")
+        return json_response({"error": "Request must be JSON"}, 400)
 
-    return jsonify({"status": "success"}), 200
+    try:
+        payload = orjson.loads(raw_body)
+    except ValueError:
+        logger.info("Request body is not valid JSON.")
+        return json_response({"error": "invalid_json"}, 400)
+    if not isinstance(payload, dict):
+        logger.info("Request body is not a JSON object.")
+        return json_response({"error": "invalid_json"}, 400)
+
+    issue_data = payload.get("issue") or {}
+    installation_id: Optional[int] = (payload.get("installation") or {}).get("id")
+    issue_title: Optional[str] = issue_data.get("title")
+    issue_body: Optional[str] = issue_data.get("body")
+    issue_node_id: Optional[str] = issue_data.get("node_id")
+    if not (
+        payload.get("action") == "opened"
+        and installation_id
+        and issue_node_id
+        and issue_title
+        and issue_body
+    ):
+        logger.info("Not an opened issue with a title and body. Nothing to do.")
+        return Response(status=204)
+
+    if not limiter.limiter.hit(
+        INSTALLATION_RATE_LIMIT, "installation", str(installation_id)
+    ):
+        logger.warning("🚨 Rate limit exceeded for installation %s.", installation_id)
+        return json_response({"error": "rate_limited"}, 429)
+
+    issue_url: Optional[str] = issue_data.get("html_url")
+
+    logger.info("Queueing New Issue: %s (%s)", issue_title, issue_url)
+    executor.submit(
+        _process_issue_opened,
+        installation_id,
+        issue_node_id,
+        issue_title,
+        issue_body,
+    )
+    return json_response({"status": "queued"}, 202)
 
 
 @app.route("/", methods=["GET"])
@@ -183,4 +546,6 @@ def index() -> str:
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=3000, debug=True)
+    # Local development only; serve with `gunicorn -c gunicorn.conf.py app:app`.
+    # Debug mode (and its reloader) is opt-in via FLASK_DEBUG=1.
+    app.run(host="0.0.0.0", port=3000)
@@ -0,0 +1,15 @@
+# Gunicorn settings for serving the webhook app: gunicorn -c gunicorn.conf.py app:app
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:3000")
+
+# A single process: the token caches, delivery dedup window, rate limits,
+# Gemini worker pool and comment batcher all live in process memory, so extra
+# processes would each get their own copy (multiplying the per-installation
+# cap and letting redeliveries dodge dedup). Webhooks are acknowledged as soon
+# as they're queued, so threads provide all the request concurrency needed.
+workers = 1
+worker_class = "gthread"
+threads = 16
+timeout = 30
+keepalive = 5
@@ -0,0 +1,47 @@
+import socket
+import threading
+
+import pytest
+import requests
+
+import app
+
+
+def test_graphql_mutation_is_not_resent_on_read_timeout() -> None:
+    """A batch GitHub may have applied must not be re-sent after a timeout."""
+    server = socket.create_server(("127.0.0.1", 0))
+    server.settimeout(5)
+    port = server.getsockname()[1]
+    connections = []
+
+    def accept_and_never_answer() -> None:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            conn.recv(65536)
+            connections.append(conn)
+
+    thread = threading.Thread(target=accept_and_never_answer, daemon=True)
+    thread.start()
+
+    session = requests.Session()
+    session.mount(
+        f"http://127.0.0.1:{port}",
+        app._gh_session.get_adapter(app.GITHUB_GRAPHQL_URL),
+    )
+    try:
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            session.post(
+                f"http://127.0.0.1:{port}/graphql",
+                json={"query": "mutation { c0: addComment }"},
+                timeout=(1, 0.5),
+            )
+    finally:
+        server.close()
+        thread.join(timeout=5)
+        for conn in connections:
+            conn.close()
+
+    assert len(connections) == 1